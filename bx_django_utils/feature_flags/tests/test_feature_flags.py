@@ -161,9 +161,8 @@ class FeatureFlagsTestCase(FeatureFlagTestCaseMixin, TestCase):
         self.assertEqual(get_feature_flag_db_info(), {'feature-flags-foo': 0})
 
         # Check flag again should only hit the cache:
-        with AssertQueries() as queries:
+        with self.assertNumQueries(0):
             self.assertFalse(flag.is_enabled)  # Still disabled?
-        queries.assert_queries(table_counts={})  # No Queries made?
 
         # Change the flag should store the new stage in cache + database:
         with AssertQueries() as queries:
@@ -180,6 +179,5 @@ class FeatureFlagsTestCase(FeatureFlagTestCaseMixin, TestCase):
         self.assertEqual(get_feature_flag_db_info(), {'feature-flags-foo': 1})
 
         # Query will only use the cache:
-        with AssertQueries() as queries:
+        with self.assertNumQueries(0):
             self.assertTrue(flag.is_enabled)  # Now it's enabled
-        queries.assert_queries(table_counts={})  # No Queries made?
@@ -30,6 +30,9 @@ DEFAULT_AFTER_MODULES = (
     'django.db',
 )
 
+# get_table_name() runs once per captured query -> compile only once:
+TABLE_NAME_RE = re.compile(r'(FROM|INSERT INTO|UPDATE) \"(.+?)\"')
+
 
 class AssertQueries(SQLQueryRecorder):
     """
@@ -77,7 +80,7 @@ class AssertQueries(SQLQueryRecorder):
             # transaction statements
             return
 
-        table_names = re.findall(r'(FROM|INSERT INTO|UPDATE) \"(.+?)\"', sql)
+        table_names = TABLE_NAME_RE.findall(sql)
         assert len(table_names) >= 1, f'Error parsing: {sql!r}'
         # Use only the first table name (e.g.: ignore names in inner join)
         table_name = table_names[0][1]
@@ -78,7 +78,8 @@ def make_test_user(
         for permission in permissions:
             assert isinstance(permission, Permission)
         user.user_permissions.set(permissions)
-    user = User.objects.get(pk=user.pk)
+        # Reload to get rid of cached permission state on the instance:
+        user = User.objects.get(pk=user.pk)
     return user
 
 
@@ -118,6 +118,8 @@ class TranslationField(models.JSONField):
         kwargs['null'] = False
         kwargs['default'] = FieldTranslation
         self.language_codes = language_codes
+        # clean() is called on every full_clean() -> build the lookup set only once:
+        self.language_codes_set = frozenset(language_codes)
         self.widget_class = kwargs.pop('widget_class', TranslationWidget)
         super().__init__(*args, **kwargs)
 
@@ -145,7 +147,7 @@ class TranslationField(models.JSONField):
         value = super().clean(value, model_instance)
         value = remove_empty_translations(value)
         existing_codes = value.keys()
-        unknown_codes = existing_codes - self.language_codes
+        unknown_codes = existing_codes - self.language_codes_set
         if unknown_codes:
             raise ValidationError(f'Unknown translation language(s): {", ".join(sorted(unknown_codes))}')
         return value
@@ -43,6 +43,13 @@ class TranslatedModelAdmin(TranslationFieldAdmin):
     list_display = ['translated', 'translated_multiline', 'not_translated']
     list_display_links = ['translated', 'translated_multiline']
 
+    # TranslatedModel has no relations yet - guard so future related
+    # list_display fields keep the changelist at one query per page.
+    list_select_related = True
+
+    # Don't issue the extra "full result count" COUNT query on filtered changelists:
+    show_full_result_count = False
+
 
 class TranslatedSlugTestModelForm(forms.ModelForm):
     """
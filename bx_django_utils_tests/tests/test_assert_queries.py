@@ -22,13 +22,22 @@ def make_database_queries2(count=1):
 
 class AssertQueriesTestCase(TestCase):
 
-    def get_instance(self):
+    @classmethod
+    def get_instance(cls):
         with AssertQueries() as queries:
             Permission.objects.all().first()
         return queries
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One known-good sample capture, shared by all tests that only read it.
+        # Note: Not in setUpTestData(), because Django would deepcopy the
+        # instance (and the used database connection is not copyable).
+        cls.sample_queries = cls.get_instance()
+
     def test_assert_queries(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_queries(
             query_count=1,
             table_names=['auth_permission'],
@@ -38,7 +47,7 @@ class AssertQueriesTestCase(TestCase):
         )
 
     def test_assert_table_names(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_table_names('auth_permission')
 
         with self.assertRaises(AssertionError) as err:
@@ -52,12 +61,12 @@ class AssertQueriesTestCase(TestCase):
         assert '1. SELECT "auth_permission"' in msg
 
     def test_assert_table_counts(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_table_counts(Counter(auth_permission=1))
         queries.assert_table_counts({'auth_permission': 1})
 
         with self.assertRaises(AssertionError) as err:
-            queries.assert_table_counts(Counter(auth_permission=2, foo=1, bar=3))
+            queries.assert_table_counts({'auth_permission': 2, 'foo': 1, 'bar': 3})
         msg = str(err.exception)
         assert 'Table count error:\n' in msg
         assert '-auth_permission: 2\n' in msg
@@ -148,7 +157,7 @@ class AssertQueriesTestCase(TestCase):
         second_queries.snapshot_table_counts()
 
     def test_assert_not_double_tables(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_not_double_tables()
 
         with self.assertRaises(AssertionError) as err:
@@ -164,7 +173,7 @@ class AssertQueriesTestCase(TestCase):
         assert '2. SELECT "auth_permission"' in msg
 
     def test_assert_duplicated_queries(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_duplicated_queries(duplicated=True, similar=True)
 
         # duplicated + similar
@@ -232,7 +241,7 @@ class AssertQueriesTestCase(TestCase):
         assert "Permission.objects.exclude(name='query 8').first()" in msg
 
     def test_assert_query_count(self):
-        queries = self.get_instance()
+        queries = self.sample_queries
         queries.assert_query_count(num=1)
 
         with self.assertRaises(AssertionError) as err:
@@ -249,9 +258,7 @@ class AssertQueriesTestCase(TestCase):
         with AssertQueries() as queries:
             Group.objects.create(name='foo')
         queries.assert_queries(
-            table_counts=Counter({
-                'auth_group': 1
-            }),
+            table_counts={'auth_group': 1},
             double_tables=True,
             table_names=['auth_group'],
             duplicated=True,
@@ -263,9 +270,7 @@ class AssertQueriesTestCase(TestCase):
         with AssertQueries() as queries:
             group = Group.objects.first()
         queries.assert_queries(
-            table_counts=Counter({
-                'auth_group': 1
-            }),
+            table_counts={'auth_group': 1},
             double_tables=True,
             table_names=['auth_group'],
             duplicated=True,
@@ -278,9 +283,7 @@ class AssertQueriesTestCase(TestCase):
             group.name = 'foo bar'
             group.save(update_fields=['name'])
         queries.assert_queries(
-            table_counts=Counter({
-                'auth_group': 1
-            }),
+            table_counts={'auth_group': 1},
             double_tables=True,
             table_names=['auth_group'],
             duplicated=True,
@@ -295,9 +298,7 @@ class AssertQueriesTestCase(TestCase):
                 group.save()
 
         queries.assert_queries(
-            table_counts=Counter({
-                'auth_group': 1
-            }),
+            table_counts={'auth_group': 1},
             double_tables=True,
             table_names=['auth_group'],
             duplicated=True,
@@ -312,9 +313,7 @@ class AssertQueriesTestCase(TestCase):
             ).count()
 
         queries.assert_queries(
-            table_counts=Counter({
-                'auth_group': 1
-            }),
+            table_counts={'auth_group': 1},
             double_tables=True,
             table_names=['auth_group'],
             duplicated=True,
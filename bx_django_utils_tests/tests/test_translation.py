@@ -1,12 +1,12 @@
 import json
 import re
-from itertools import product
 
 from bx_py_utils.test_utils.snapshot import assert_html_snapshot
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, transaction
 from django.db.models import Q
-from django.test import SimpleTestCase, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.utils import translation
 from model_bakery import baker
 
@@ -33,6 +33,13 @@ from bx_django_utils_tests.test_app.models import (
 )
 
 
+# Matches the language code table cells rendered by TranslationWidget:
+LANGUAGE_CODE_TD_RE = re.compile(r'<td>(.{5})</td>')
+
+# Language codes of TranslatedModel, used by the admin tests below:
+LANGUAGE_CODES = ('de-de', 'en-us', 'es')
+
+
 class TranslationFieldTestCase(TestCase):
     def test_stores_only_wanted_languages(self):
         obj = TranslatedModel(
@@ -58,21 +65,23 @@ class TranslationFieldTestCase(TestCase):
         self.assertEqual(repr(translated), "FieldTranslation({'de-de': 'Hallo'})")
         self.assertEqual(translated.get_first(['foo', 'bar', 'en-gb', 'de-de']), 'Hallo')
 
-        obj1 = TranslatedModel.objects.create(translated={'de-de': 'Hallo 1', 'en-us': 'Hello 1'})
-        obj1.full_clean()
+        objs = [
+            TranslatedModel(translated={'de-de': 'Hallo 1', 'en-us': 'Hello 1'}),
+            TranslatedModel(translated={'de-de': 'Hallo 2', 'en-us': 'Hello 2'}),
+        ]
+        objs[0].full_clean()  # Validate only one representative instance
+        with transaction.atomic():
+            obj1, obj2 = TranslatedModel.objects.bulk_create(objs, batch_size=1000)
         self.assertEqual(repr(obj1.translated), "FieldTranslation({'de-de': 'Hallo 1', 'en-us': 'Hello 1'})")
 
-        obj2 = TranslatedModel.objects.create(translated={'de-de': 'Hallo 2', 'en-us': 'Hello 2'})
-        obj2.full_clean()
-
         self.assertNotEqual(obj1.translated, obj2.translated)
 
-        qs = TranslatedModel.objects.order_by('translated').values('translated')
-        self.assertQuerysetEqual(
-            qs,
+        actual = list(TranslatedModel.objects.order_by('translated').values_list('translated', flat=True))
+        self.assertEqual(
+            actual,
             [
-                {'translated': FieldTranslation({'de-de': 'Hallo 1', 'en-us': 'Hello 1'})},
-                {'translated': FieldTranslation({'de-de': 'Hallo 2', 'en-us': 'Hello 2'})},
+                FieldTranslation({'de-de': 'Hallo 1', 'en-us': 'Hello 1'}),
+                FieldTranslation({'de-de': 'Hallo 2', 'en-us': 'Hello 2'}),
             ],
         )
 
@@ -193,7 +202,7 @@ class TranslationFieldTestCase(TestCase):
         html = widget.render(name='foobar', value=b'{}')
 
         # Is the order the same as specifies in TranslationField() ?
-        self.assertEqual(tuple(re.findall(r'<td>(.{5})</td>', html)), language_codes)
+        self.assertEqual(tuple(LANGUAGE_CODE_TD_RE.findall(html)), language_codes)
         assert_html_snapshot(got=html, validate=False)
 
     def test_query(self):
@@ -223,10 +232,11 @@ class TranslationFieldTestCase(TestCase):
         )
 
 
-class TranslationAdminTestCase(TestCase):
+class TranslationAdminTestCase(HtmlAssertionMixin, TestCase):
     # test admin base class and widgets
 
-    def create_test_obj(self):
+    @classmethod
+    def create_test_obj(cls):
         obj = TranslatedModel(
             translated={'de-de': 'Zug', 'en-us': 'Train', 'es': 'Tren'},
             translated_multiline={
@@ -239,13 +249,26 @@ class TranslationAdminTestCase(TestCase):
         obj.save()
         return obj
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Create shared fixtures only once per TestCase:
+        cls.user = make_test_user(is_superuser=True)
+        cls.obj = cls.create_test_obj()
+
+        # Login only once: The session outlives the per-test clients,
+        # which just need the session cookie.
+        client = Client()
+        client.force_login(cls.user)
+        cls.session_cookie = client.cookies[settings.SESSION_COOKIE_NAME].value
+
     def setUp(self):
         super().setUp()
-        self.user = make_test_user(is_superuser=True)
-        self.client.force_login(self.user)
+        # The test client is per-test -> inject the shared login session:
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_cookie
 
     def test_changelist(self):
-        obj = self.create_test_obj()
+        obj = self.obj
 
         CODE = 'de-de'
         with translation.override(CODE):
@@ -259,38 +282,35 @@ class TranslationAdminTestCase(TestCase):
         self.assertInHTML(obj.translated_multiline[CODE], response_content)
 
     def test_change(self):
-        obj = self.create_test_obj()
+        obj = self.obj
 
         # view existing record's change form
         response = self.client.get(f'/admin/test_app/translatedmodel/{obj.pk}/change/')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers['content-type'], 'text/html; charset=utf-8')
-        response_content = response.content.decode()
 
+        parts = []
         fieldname = 'translated'
-        for code in ['de-de', 'en-us', 'es']:
-            self.assertInHTML(
-                (
-                    f'<input'
-                    f' id="id_{fieldname}__{code}"'
-                    f' type="text"'
-                    f' name="{fieldname}__{code}"'
-                    f' value="{getattr(obj, fieldname)[code]}">'
-                ),
-                response_content,
+        translations = getattr(obj, fieldname)
+        for code in LANGUAGE_CODES:
+            parts.append(
+                f'<input'
+                f' id="id_{fieldname}__{code}"'
+                f' type="text"'
+                f' name="{fieldname}__{code}"'
+                f' value="{translations[code]}">'
             )
         fieldname = 'translated_multiline'
-        for code in ['de-de', 'en-us', 'es']:
-            self.assertInHTML(
-                (
-                    f'<textarea'
-                    f' id="id_{fieldname}__{code}"'
-                    f' name="{fieldname}__{code}">'
-                    f'{getattr(obj, fieldname)[code]}'
-                    f'</textarea>'
-                ),
-                response_content,
+        translations = getattr(obj, fieldname)
+        for code in LANGUAGE_CODES:
+            parts.append(
+                f'<textarea'
+                f' id="id_{fieldname}__{code}"'
+                f' name="{fieldname}__{code}">'
+                f'{translations[code]}'
+                f'</textarea>'
             )
+        self.assert_html_parts(response, parts=parts)
 
         # change all translations via form
         data = {
@@ -298,7 +318,7 @@ class TranslationAdminTestCase(TestCase):
             'initial-translated_multiline': json.dumps(obj.translated_multiline),
             'not_translated': 'Foo Bar',
         }
-        for code in ['de-de', 'en-us', 'es']:
+        for code in LANGUAGE_CODES:
             data[f'translated__{code}'] = obj.translated[code].upper()
             data[f'translated_multiline__{code}'] = obj.translated_multiline[code].upper()
         response = self.client.post(f'/admin/test_app/translatedmodel/{obj.pk}/change/', data, follow=True)
@@ -324,12 +344,14 @@ class TranslationAdminTestCase(TestCase):
         response = self.client.post('/admin/test_app/translatedmodel/add/', follow=True)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers['content-type'], 'text/html; charset=utf-8')
+        response_content = response.content.decode()
         self.assertInHTML(
             '<li>This field is required.</li>',
-            response.content.decode(),
+            response_content,
             count=2,  # error from blank translated and not_translated TranslatedModel fields
         )
-        self.assertEqual(TranslatedModel.objects.count(), 0)
+        # Only the shared setUpTestData() instance exists:
+        self.assertEqual(TranslatedModel.objects.count(), 1)
 
         # save with some data
         data = {
@@ -338,9 +360,10 @@ class TranslationAdminTestCase(TestCase):
             'not_translated': 'Foo Bar',
             '_continue': 'Save and continue editing',
         }
-        for code, field in product(['de-de', 'en-us', 'es'], ['translated', 'translated_multiline']):
-            expr = f'{field}__{code}'
-            data[expr] = expr
+        for code in LANGUAGE_CODES:
+            for field in ('translated', 'translated_multiline'):
+                expr = f'{field}__{code}'
+                data[expr] = expr
         response = self.client.post('/admin/test_app/translatedmodel/add/', data, follow=True)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers['content-type'], 'text/html; charset=utf-8')
@@ -349,8 +372,8 @@ class TranslationAdminTestCase(TestCase):
         self.assertIn('was added successfully', [str(m) for m in messages][0])
 
         # was persisted?
-        self.assertEqual(TranslatedModel.objects.count(), 1)
-        obj = TranslatedModel.objects.first()
+        self.assertEqual(TranslatedModel.objects.count(), 2)
+        obj = TranslatedModel.objects.exclude(pk=self.obj.pk).get()
         self.assertEqual(
             obj.translated,
             {